@@ -1,8 +1,39 @@
 import numpy as np
 import plotly.graph_objects as go
+import ast
 import json
 import csv
+import operator
 import os
+import struct
+from functools import lru_cache
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional dependency
+    numba = None
+
+try:
+    import numexpr
+except ImportError:  # pragma: no cover - optional dependency
+    numexpr = None
+
+try:
+    import pyfftw
+    from pyfftw.interfaces import scipy_fft as _fft
+
+    pyfftw.interfaces.cache.enable()
+    pyfftw.interfaces.cache.set_keepalive_time(60)
+    _FFT_KW = {"workers": -1, "planner_effort": "FFTW_MEASURE"}
+except ImportError:  # pragma: no cover - optional dependency
+    pyfftw = None
+    try:
+        from scipy import fft as _fft
+
+        _FFT_KW = {"workers": -1}
+    except ImportError:
+        _fft = np.fft
+        _FFT_KW = {}
 
 __all__ = [
     "BaseSeries",
@@ -18,40 +49,239 @@ __all__ = [
 ]
 
 
+# Below this length the parallel kernel does not pay for its thread start-up.
+# Its bisection is slower than np.interp per thread, so it also needs more
+# than one thread to win.
+_NUMBA_INTERP_MIN = 4096
+
+if numba is not None:
+
+    # fastmath without the no-NaN/no-inf assumptions, which np.interp does not make
+    @numba.njit(
+        parallel=True,
+        fastmath={"nsz", "arcp", "contract", "afn", "reassoc"},
+        cache=True,
+    )
+    def _interp_nb(x_new, xp, fp):
+        """Parallel equivalent of :func:`numpy.interp` for real ``float64`` data."""
+        out = np.empty_like(x_new)
+        last = xp.size - 1
+        for i in numba.prange(x_new.size):
+            xi = x_new[i]
+            if xi < xp[0]:
+                out[i] = fp[0]
+            elif xi >= xp[last]:
+                out[i] = fp[last]
+            else:
+                lo, hi = 0, last
+                while hi - lo > 1:
+                    mid = (lo + hi) >> 1
+                    if xp[mid] <= xi:
+                        lo = mid
+                    else:
+                        hi = mid
+                if xi == xp[lo]:
+                    out[i] = fp[lo]
+                    continue
+                out[i] = fp[lo] + (fp[hi] - fp[lo]) * (xi - xp[lo]) / (xp[hi] - xp[lo])
+        return out
+
+    @numba.njit(cache=True)
+    def _lerp_at(xp, fp, i, xi):
+        # ``i`` is the number of samples in ``xp`` that are <= ``xi``
+        if i == 0:
+            return fp[0]
+        if i == xp.size or xi == xp[i - 1]:
+            return fp[i - 1]
+        return fp[i - 1] + (fp[i] - fp[i - 1]) * (xi - xp[i - 1]) / (xp[i] - xp[i - 1])
+
+    @numba.njit(cache=True)
+    def _merge_interp_nb(ax, av, bx, bv):
+        """Merge two sorted axes and interpolate both series in one pass.
+
+        Returns the deduplicated union of ``ax`` and ``bx`` together with
+        ``av`` and ``bv`` interpolated onto it, matching :func:`numpy.interp`.
+        """
+        na = ax.size
+        nb = bx.size
+        x = np.empty(na + nb)
+        v1 = np.empty(na + nb)
+        v2 = np.empty(na + nb)
+        i = j = k = 0
+        while i < na or j < nb:
+            if j == nb or (i < na and ax[i] <= bx[j]):
+                xi = ax[i]
+            else:
+                xi = bx[j]
+            while i < na and ax[i] <= xi:
+                i += 1
+            while j < nb and bx[j] <= xi:
+                j += 1
+            x[k] = xi
+            v1[k] = _lerp_at(ax, av, i, xi)
+            v2[k] = _lerp_at(bx, bv, j, xi)
+            k += 1
+        return x[:k], v1[:k], v2[:k]
+
+else:
+    _interp_nb = None
+    _merge_interp_nb = None
+
+
+_WISDOM_FILE = os.path.join(os.path.expanduser("~"), ".cache", "pysig", "fftw_wisdom")
+
+# (shape, n, axis, dtype, direction) transforms planned in this process
+_fftw_planned = set()
+
+
+def _load_wisdom():
+    try:
+        with open(_WISDOM_FILE, "r", encoding="utf-8") as f:
+            wisdom = json.load(f)
+        pyfftw.import_wisdom(tuple(w.encode("ascii") for w in wisdom))
+    except (OSError, ValueError, TypeError, AttributeError):
+        pass
+
+
+def _save_wisdom():
+    try:
+        os.makedirs(os.path.dirname(_WISDOM_FILE), exist_ok=True)
+        with open(_WISDOM_FILE, "w", encoding="utf-8") as f:
+            json.dump([w.decode("ascii") for w in pyfftw.export_wisdom()], f)
+    except OSError:
+        pass
+
+
+if pyfftw is not None:
+    _load_wisdom()
+
+
+def _transform(func, a, n, direction, axis=-1):
+    """Run an FFT backend function, saving FFTW wisdom for new plans."""
+    result = func(a, n, axis=axis, **_FFT_KW)
+    if pyfftw is not None:
+        key = (a.shape, n, axis, a.dtype.str, direction)
+        if key not in _fftw_planned:
+            _fftw_planned.add(key)
+            _save_wisdom()
+    return result
+
+
+@lru_cache(maxsize=32)
+def _rfftfreq_cached(n, dt_bits):
+    freqs = _fft.rfftfreq(n, d=struct.unpack("d", struct.pack("q", dt_bits))[0])
+    freqs.flags.writeable = False
+    return freqs
+
+
+def _rfftfreq(n, dt):
+    """Return a shared, read-only :func:`rfftfreq` array memoised by ``(n, dt)``."""
+    # key on the bit pattern of ``dt`` so the float lookup is exact
+    return _rfftfreq_cached(n, struct.unpack("q", struct.pack("d", dt))[0])
+
+
+def _merge_sorted(a, b):
+    """Return the sorted union of the already sorted arrays ``a`` and ``b``."""
+    merged = np.concatenate((a, b))
+    # timsort detects the two sorted runs and merges them in linear time
+    merged.sort(kind="mergesort")
+    if merged.size < 2:
+        return merged
+    keep = np.empty(merged.shape, dtype=bool)
+    keep[0] = True
+    np.not_equal(merged[1:], merged[:-1], out=keep[1:])
+    return merged[keep]
+
+
+def _as_dtype(a, dtype):
+    """Return ``a`` as a C-contiguous ``dtype`` array, copying only if needed."""
+    if isinstance(a, np.ndarray) and a.dtype == dtype and a.flags.c_contiguous:
+        return a
+    return np.ascontiguousarray(a, dtype=dtype)
+
+
+def _as_f64(a):
+    return _as_dtype(a, np.float64)
+
+
+def _as_c128(a):
+    return _as_dtype(a, np.complex128)
+
+
 class BaseSeries:
     """Base class for ordered data used by ``Signal`` and ``Spectrum``."""
 
-    def __init__(self, axis, values):
-        self.x = np.asarray(axis, dtype=float)
-        self.values = np.asarray(values)
-        if self.x.shape != self.values.shape:
+    def __init__(self, axis, values, _trusted=False):
+        # ``_trusted`` is set by internal callers whose axis and values are
+        # already known to match.
+        self.x = _as_f64(axis)
+        values = np.asarray(values)
+        if not _trusted and self.x.shape != values.shape:
             raise ValueError("axis and values must have same length")
+        self.values = values
 
     # ---- internal helpers -------------------------------------------------
+    def _is_uniform(self):
+        """Return whether ``x`` is evenly spaced."""
+        # not cached: ``x`` may be modified in place
+        if self.x.size < 2:
+            return False
+        step = self.x[1] - self.x[0]
+        return bool(np.ptp(np.diff(self.x)) <= 1e-12 * abs(step))
+
+    def _same_axis(self, other):
+        """Return ``True`` when ``other`` is sampled on exactly ``self.x``."""
+        return other.x is self.x or (
+            other.x.shape == self.x.shape and np.array_equal(other.x, self.x)
+        )
+
+    def _axis_slice(self, x):
+        """Return the slice of ``self.x`` equal to ``x``, or ``None``."""
+        if x is self.x:
+            return slice(None)
+        if np.ndim(x) != 1 or not 0 < x.size <= self.x.size:
+            return None
+        lo = int(np.searchsorted(self.x, x[0]))
+        hi = lo + x.size
+        if (
+            hi <= self.x.size
+            and self.x[lo] == x[0]
+            and self.x[hi - 1] == x[-1]
+            and np.array_equal(self.x[lo:hi], x)
+        ):
+            return slice(lo, hi)
+        return None
+
     def _interp(self, x):
-        if np.iscomplexobj(self.values):
-            real = np.interp(x, self.x, self.values.real)
-            imag = np.interp(x, self.x, self.values.imag)
-            return real + 1j * imag
+        slc = self._axis_slice(x)
+        if slc is not None:
+            return self.values[slc]
+        # np.interp also takes complex values directly
         return np.interp(x, self.x, self.values)
 
+    def _merge_interp(self, other):
+        """Return the merged axis and both series interpolated onto it."""
+        x = _merge_sorted(self.x, other.x)
+        return x, self._interp(x), other._interp(x)
+
     def _binary_op(self, other, func):
         if isinstance(other, self.__class__):
-            x = np.union1d(self.x, other.x)
-            v1 = self._interp(x)
-            v2 = other._interp(x)
-            return self.__class__(x, func(v1, v2))
+            if self._same_axis(other):
+                values = func(self.values, other.values)
+                return self.__class__(self.x, values, _trusted=True)
+            x, v1, v2 = self._merge_interp(other)
+            return self.__class__(x, func(v1, v2), _trusted=True)
         raise TypeError(f"Can only operate with {self.__class__.__name__}")
 
     # ---- arithmetic operations --------------------------------------------
     def __add__(self, other):
-        return self._binary_op(other, lambda a, b: a + b)
+        return self._binary_op(other, np.add)
 
     def __radd__(self, other):
         return self.__add__(other)
 
     def __sub__(self, other):
-        return self._binary_op(other, lambda a, b: a - b)
+        return self._binary_op(other, np.subtract)
 
     def __rsub__(self, other):
         if isinstance(other, self.__class__):
@@ -60,7 +290,7 @@ class BaseSeries:
 
     def __mul__(self, other):
         if np.isscalar(other):
-            return self.__class__(self.x, self.values * other)
+            return self.__class__(self.x, self.values * other, _trusted=True)
         raise TypeError("Can only multiply by scalar")
 
     def __rmul__(self, other):
@@ -68,16 +298,16 @@ class BaseSeries:
 
     def __truediv__(self, other):
         if np.isscalar(other):
-            return self.__class__(self.x, self.values / other)
+            return self.__class__(self.x, self.values / other, _trusted=True)
         raise TypeError("Can only divide by scalar")
 
     def __rtruediv__(self, other):
         if np.isscalar(other):
-            return self.__class__(self.x, other / self.values)
+            return self.__class__(self.x, other / self.values, _trusted=True)
         raise TypeError("Can only divide by scalar numerator")
 
     def __neg__(self):
-        return self.__class__(self.x, -self.values)
+        return self.__class__(self.x, -self.values, _trusted=True)
 
     # ---- persistence ------------------------------------------------------
 
@@ -164,41 +394,105 @@ class BaseSeries:
 class Signal(BaseSeries):
     """Simple signal class representing values over time."""
 
-    def __init__(self, times, values):
-        super().__init__(times, np.asarray(values, dtype=float))
+    def __init__(self, times, values, _trusted=False):
+        super().__init__(times, _as_f64(values), _trusted)
 
     @property
     def times(self):
         return self.x
 
+    def _interp(self, x):
+        if (
+            _interp_nb is not None
+            and np.size(x) > _NUMBA_INTERP_MIN
+            and numba.get_num_threads() > 1
+            and self._axis_slice(x) is None
+        ):
+            return _interp_nb(_as_f64(x), self.x, _as_f64(self.values))
+        return super()._interp(x)
+
+    def _merge_interp(self, other):
+        # the merge kernel needs finite axes: a NaN time never compares
+        # <= itself, so the walk would stop advancing
+        if (
+            _merge_interp_nb is not None
+            and self.x.size + other.x.size > _NUMBA_INTERP_MIN
+            and np.isfinite(self.x).all()
+            and np.isfinite(other.x).all()
+        ):
+            return _merge_interp_nb(self.x, self.values, other.x, other.values)
+        return super()._merge_interp(other)
+
     def value(self, time):
         """Return signal value interpolated at given time."""
         return float(np.interp(time, self.times, self.values))
 
     def time(self, value):
         """Return time closest to the given value."""
-        idx = np.argmin(np.abs(self.values - value))
+        values = self.values
+        # checked per call rather than cached, since values may change in place
+        if (values[1:] >= values[:-1]).all():
+            idx = int(np.searchsorted(values, value))
+            if idx == len(values) or (
+                idx > 0 and value - values[idx - 1] <= values[idx] - value
+            ):
+                # first sample holding the lower neighbour, as argmin would pick
+                idx = int(np.searchsorted(values, values[idx - 1]))
+        else:
+            diff = np.subtract(values, value, out=np.empty_like(values))
+            np.abs(diff, out=diff)
+            idx = diff.argmin()
         return float(self.times[idx])
 
-    def fft(self, n=None):
-        """Return the spectrum using FFT. Resamples to a uniform grid."""
+    def fft(self, n=None, dtype=None):
+        """Return the spectrum using FFT. Resamples to a uniform grid.
+
+        Passing ``dtype=np.float32`` runs the transform in single precision.
+        """
         if n is None:
             n = len(self.values)
-        # create uniform grid
-        t_min = self.times.min()
-        t_max = self.times.max()
-        uniform_t = np.linspace(t_min, t_max, len(self.values))
-        uniform_v = np.interp(uniform_t, self.times, self.values)
-        freqs = np.fft.rfftfreq(n, d=(uniform_t[1] - uniform_t[0]))
-        spec = np.fft.rfft(uniform_v, n)
-        return Spectrum(freqs, spec)
+        dt = self.times[1] - self.times[0]
+        if self._is_uniform():
+            # already uniform, no resampling needed
+            uniform_v = self.values
+        else:
+            # create uniform grid
+            t_min = self.times.min()
+            t_max = self.times.max()
+            uniform_t = np.linspace(t_min, t_max, len(self.values))
+            uniform_v = self._interp(uniform_t)
+            dt = uniform_t[1] - uniform_t[0]
+        if dtype is not None:
+            uniform_v = uniform_v.astype(dtype, copy=False)
+        freqs = _rfftfreq(n, dt)
+        spec = _transform(_fft.rfft, uniform_v, n, "forward")
+        return Spectrum(freqs, spec, _trusted=True)
+
+    @classmethod
+    def batch_fft(cls, signals, n=None):
+        """Return spectra of ``signals`` computed with a single batched FFT.
+
+        All signals are resampled onto one uniform grid spanning their
+        combined time range, so the returned spectra share a frequency axis.
+        ``n`` defaults to the length of the longest signal.
+        """
+        signals = list(signals)
+        t_min = min(s.times.min() for s in signals)
+        t_max = max(s.times.max() for s in signals)
+        if n is None:
+            n = max(len(s.values) for s in signals)
+        uniform_t = np.linspace(t_min, t_max, n)
+        arr = np.stack([s._interp(uniform_t) for s in signals])
+        spec = _transform(_fft.rfft, arr, n, "forward")
+        freqs = _rfftfreq(n, uniform_t[1] - uniform_t[0])
+        return [Spectrum(freqs, row, _trusted=True) for row in spec]
 
 
 class Spectrum(BaseSeries):
     """Frequency spectrum with complex values."""
 
-    def __init__(self, freqs, values):
-        super().__init__(freqs, np.asarray(values, dtype=complex))
+    def __init__(self, freqs, values, _trusted=False):
+        super().__init__(freqs, _as_c128(values), _trusted)
 
     @property
     def freqs(self):
@@ -213,13 +507,13 @@ class Spectrum(BaseSeries):
         else:
             dt = 1.0
         times = np.arange(n) * dt
-        values = np.fft.irfft(self.values, n)
-        return Signal(times, values)
+        values = _transform(_fft.irfft, self.values, n, "backward")
+        return Signal(times, values, _trusted=True)
 
 
 def _apply_unary(func, obj):
     if isinstance(obj, BaseSeries):
-        return obj.__class__(obj.x, func(obj.values))
+        return obj.__class__(obj.x, func(obj.values), _trusted=True)
     raise TypeError("Unsupported type for unary operation")
 
 
@@ -240,7 +534,24 @@ def exp(obj):
 
 def db(spectrum):
     """Return magnitude of spectrum in dB."""
-    return 20 * np.log10(np.abs(spectrum.values))
+    values = spectrum.values
+    if not np.iscomplexobj(values):
+        return 20 * np.log10(np.abs(values))
+    # 20*log10(|z|) == 10*log10(|z|**2), which avoids the sqrt in np.abs
+    mag2 = values.real * values.real
+    mag2 += values.imag * values.imag
+    np.log10(mag2, out=mag2)
+    mag2 *= 10.0
+    return mag2
+
+
+# Traces longer than this are drawn with WebGL instead of SVG.
+_WEBGL_MIN = 2048
+
+_LAYOUT = {
+    "xaxis_title": "Time/Frequency",
+    "yaxis_title": "Amplitude",
+}
 
 
 def plot(*items, filename="plot.html"):
@@ -253,8 +564,9 @@ def plot(*items, filename="plot.html"):
     fig = go.Figure()
     for idx, item in enumerate(items):
         if isinstance(item, Signal):
+            scatter = go.Scattergl if item.x.size > _WEBGL_MIN else go.Scatter
             fig.add_trace(
-                go.Scatter(
+                scatter(
                     x=item.times,
                     y=item.values,
                     mode="lines",
@@ -262,8 +574,9 @@ def plot(*items, filename="plot.html"):
                 )
             )
         elif isinstance(item, Spectrum):
+            scatter = go.Scattergl if item.x.size > _WEBGL_MIN else go.Scatter
             fig.add_trace(
-                go.Scatter(
+                scatter(
                     x=item.freqs,
                     y=np.abs(item.values),
                     mode="lines",
@@ -271,25 +584,143 @@ def plot(*items, filename="plot.html"):
                 )
             )
         else:
+            data = np.asarray(item)
+            scatter = go.Scattergl if data.size > _WEBGL_MIN else go.Scatter
             fig.add_trace(
-                go.Scatter(
-                    y=np.asarray(item),
+                scatter(
+                    y=data,
                     mode="lines",
                     name=f"Data {idx}",
                 )
             )
-    fig.update_layout(
-        xaxis_title="Time/Frequency",
-        yaxis_title="Amplitude",
-    )
+    fig.update_layout(**_LAYOUT)
 
     fig.write_html(filename, auto_open=True)
     return fig
 
 
 def nrange(start, stop, step):
-    """Return inclusive range similar to :func:`numpy.arange`."""
-    return np.arange(start, stop + step, step)
+    """Return inclusive range similar to :func:`numpy.arange`.
+
+    The number of points is ``round((stop - start) / step) + 1`` and the
+    samples come from :func:`numpy.linspace`, so both endpoints are exact
+    and the spacing is uniform.
+    """
+    n = int(round((stop - start) / step)) + 1
+    if n < 1:
+        return np.empty(0, dtype=float)
+    return np.linspace(start, stop, n)
+
+
+# Names available to ``create`` expressions; copied per call to add the axis.
+_BASE_ENV = {
+    "np": np,
+    "sin": np.sin,
+    "cos": np.cos,
+    "exp": np.exp,
+}
+
+
+_FOLD_BINOPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+_FOLD_UNARYOPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+def _is_number(node):
+    return (
+        isinstance(node, ast.Constant)
+        and isinstance(node.value, (int, float, complex))
+        and not isinstance(node.value, bool)
+    )
+
+
+class _ConstantFolder(ast.NodeTransformer):
+    """Replace scalar-only subexpressions such as ``2*np.pi*50`` by their value."""
+
+    def visit_Attribute(self, node):
+        if (
+            isinstance(node.value, ast.Name)
+            and node.value.id == "np"
+            and node.attr in ("pi", "e")
+        ):
+            return ast.copy_location(ast.Constant(getattr(np, node.attr)), node)
+        return self.generic_visit(node)
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        op = _FOLD_UNARYOPS.get(type(node.op))
+        if op is not None and _is_number(node.operand):
+            return ast.copy_location(ast.Constant(op(node.operand.value)), node)
+        return node
+
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        op = _FOLD_BINOPS.get(type(node.op))
+        if op is not None and _is_number(node.left) and _is_number(node.right):
+            try:
+                value = op(node.left.value, node.right.value)
+            except ArithmeticError:
+                return node
+            return ast.copy_location(ast.Constant(value), node)
+        return node
+
+
+@lru_cache(maxsize=256)
+def _fold(expr):
+    """Return the parsed ``create`` expression with scalar subtrees folded."""
+    tree = _ConstantFolder().visit(ast.parse(expr, mode="eval"))
+    return ast.fix_missing_locations(tree)
+
+
+@lru_cache(maxsize=256)
+def _compile(expr):
+    """Return the cached code object for a ``create`` expression."""
+    return compile(_fold(expr), "<pysig-create>", "eval")
+
+
+@lru_cache(maxsize=256)
+def _names(expr):
+    """Return the names referenced by a ``create`` expression."""
+    tree = ast.parse(expr, mode="eval")
+    return frozenset(n.id for n in ast.walk(tree) if isinstance(n, ast.Name))
+
+
+def _evaluate(expr, name, axis):
+    """Evaluate ``expr`` with ``name`` bound to ``axis``.
+
+    ``numexpr`` is used when available so the whole expression runs as one
+    fused loop; expressions it cannot handle fall back to :func:`eval`.
+    Only names from ``_BASE_ENV`` are offered to ``numexpr`` so both paths
+    accept the same expressions.
+    """
+    if numexpr is not None and _names(expr) <= _BASE_ENV.keys() | {name}:
+        # numexpr gets the original source: unparsing the folded tree loses
+        # the parentheses around negative constants, e.g. ``(-2)**t``.
+        try:
+            return numexpr.evaluate(
+                expr.replace("np.pi", "pi"),
+                local_dict={name: axis, "pi": np.pi},
+                global_dict={},
+            )
+        except (
+            AttributeError,
+            KeyError,
+            NotImplementedError,
+            SyntaxError,
+            TypeError,
+            ValueError,
+        ):
+            pass
+    env = dict(_BASE_ENV)
+    env[name] = axis
+    return eval(_compile(expr), {"__builtins__": {}}, env)
 
 
 def create(expr, axis):
@@ -312,23 +743,13 @@ def create(expr, axis):
     """
 
     axis = np.asarray(axis, dtype=float)
-    env = {
-        "np": np,
-        "sin": np.sin,
-        "cos": np.cos,
-        "exp": np.exp,
-    }
 
     if "t" in expr and "f" in expr:
         raise ValueError("expression should not contain both 't' and 'f'")
 
     if "t" in expr:
-        env["t"] = axis
-        values = eval(expr, {"__builtins__": {}}, env)
-        return Signal(axis, values)
+        return Signal(axis, _evaluate(expr, "t", axis))
     if "f" in expr:
-        env["f"] = axis
-        values = eval(expr, {"__builtins__": {}}, env)
-        return Spectrum(axis, values)
+        return Spectrum(axis, _evaluate(expr, "f", axis))
 
     raise ValueError("expression must contain either 't' or 'f'")
@@ -36,7 +36,195 @@ def test_create_save_load():
     print("round-trip equal:", np.allclose(sig.values, restored.values))
 
 
+def test_merged_axis():
+    """Arithmetic on misaligned signals matches union + interpolation."""
+    s1, s2 = sample_signals()
+    s3 = s1 + s2
+    x = np.union1d(s1.times, s2.times)
+    expected = np.interp(x, s1.times, s1.values) + np.interp(x, s2.times, s2.values)
+    assert np.array_equal(s3.times, x)
+    assert np.allclose(s3.values, expected)
+
+
+def test_batch_fft():
+    """Batched FFT matches transforming each resampled signal on its own."""
+    s1, s2 = sample_signals()
+    sp1, sp2 = ps.Signal.batch_fft([s1, s2])
+    t = np.linspace(1e-3, 4e-3, 4)
+    assert np.allclose(sp1.values, np.fft.rfft(np.interp(t, s1.times, s1.values)))
+    assert np.allclose(sp2.values, np.fft.rfft(np.interp(t, s2.times, s2.values)))
+    assert np.allclose(sp1.freqs, np.fft.rfftfreq(4, d=1e-3))
+
+
+def test_nrange():
+    """nrange includes both endpoints with a uniform step."""
+    axis = ps.nrange(0, 1, 0.001)
+    assert len(axis) == 1001
+    assert axis[0] == 0 and axis[-1] == 1
+    assert np.allclose(np.diff(axis), 0.001)
+    assert len(ps.nrange(0, 1, -0.1)) == 0
+
+
+def test_create_matches_eval():
+    """create() agrees with plain eval, including folded negative constants."""
+    axis = ps.nrange(0, 1, 0.1)
+    env = {"np": np, "sin": np.sin, "cos": np.cos, "exp": np.exp, "t": axis}
+    for expr in [
+        "t*(-2)**2",
+        "(-2)**t",
+        "(1-3)**t",
+        "-2**2*t",
+        "sin(2*np.pi*50*t)",
+        "1/2*t - -3",
+    ]:
+        with np.errstate(invalid="ignore"):
+            expected = eval(expr, env)
+            values = ps.create(expr, axis).values
+        assert np.allclose(values, expected, equal_nan=True)
+
+
+def test_create_names():
+    """Names outside the create() namespace are rejected with or without numexpr."""
+    axis = ps.nrange(0, 1, 0.1)
+    backend = ps.numexpr
+    try:
+        for module in (backend, None):
+            ps.numexpr = module
+            try:
+                ps.create("abs(t-0.5)", axis)
+            except NameError:
+                pass
+            else:
+                raise AssertionError("abs should not be available")
+    finally:
+        ps.numexpr = backend
+
+
+def test_long_merged_axis():
+    """Arithmetic on long misaligned signals, including a NaN time sample."""
+    t1 = np.linspace(0, 1, 3000)
+    t2 = np.linspace(0.05, 1.2, 2000)
+    s1 = ps.Signal(t1, np.sin(10 * t1))
+    s2 = ps.Signal(t2, np.cos(7 * t2))
+    s3 = s1 - s2
+    x = np.union1d(t1, t2)
+    expected = np.interp(x, t1, s1.values) - np.interp(x, t2, s2.values)
+    assert np.array_equal(s3.times, x)
+    assert np.allclose(s3.values, expected)
+
+    t1 = t1.copy()
+    t1[1500] = np.nan
+    s4 = ps.Signal(t1, s1.values) + s2
+    assert len(s4.times) == len(s4.values)
+
+
+def test_interp_edges():
+    """Interpolation matches numpy.interp for duplicated and non-finite samples."""
+    s = ps.Signal([0, 1, 2, 2], [0, 1, 5, 6]) + ps.Signal([0, 3], [0, 0])
+    assert np.array_equal(s.values, [0, 1, 6, 6])
+    s = ps.Signal([0, 1, 2], [1, np.inf, 3]) + ps.Signal([0, 0.5, 2], [0, 0, 0])
+    assert np.array_equal(s.values, [1, np.inf, np.inf, 3])
+
+
+def test_interp_kernel():
+    """The parallel interpolation kernel matches numpy.interp."""
+    if ps._interp_nb is None:
+        return
+    xp = np.concatenate(([0.0], np.linspace(0, 1, 5000), [1.0]))
+    fp = np.sin(20 * xp)
+    fp[0] = 5.0
+    x = np.concatenate((xp, np.linspace(-0.5, 1.5, 6000)))
+    assert np.allclose(ps._interp_nb(x, xp, fp), np.interp(x, xp, fp))
+
+
+def test_unary_long_readonly():
+    """sin/cos/exp/db work on long, read-only inputs."""
+    t = np.linspace(0, 1, 20000)
+    values = np.sin(50 * t)
+    values.flags.writeable = False
+    sig = ps.Signal(t, values)
+    assert np.allclose(ps.sin(sig).values, np.sin(values))
+    assert np.allclose(ps.cos(sig).values, np.cos(values))
+    assert np.allclose(ps.exp(sig).values, np.exp(values))
+    sp = sig.fft()
+    assert np.allclose(ps.db(sp), 20 * np.log10(np.abs(sp.values)))
+
+
+def test_time_lookup():
+    """time() picks the same sample as argmin, including ties and duplicates."""
+    cases = [
+        [0.0, 1.0, 2.0, 3.0],
+        [1.0, 1.0, 3.0, 3.0, 3.0, 5.0],
+        [3.0, 2.0, 1.0, 0.0],
+        [0.0, 2.0, 1.0, 2.0],
+    ]
+    for values in cases:
+        values = np.array(values)
+        sig = ps.Signal(np.arange(len(values)) * 1e-3, values)
+        for v in [-1.0, 0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 4.0, 6.0]:
+            expected = sig.times[np.argmin(np.abs(values - v))]
+            assert sig.time(v) == expected, (values, v)
+
+    sig = ps.Signal([0, 1, 2, 3], [0, 1, 2, 3])
+    sig.time(2.9)
+    sig.values[:] = [3, 2, 1, 0]
+    assert sig.time(1.1) == 2.0
+
+
+def test_interp_subrange():
+    """Axes lying strictly inside another axis interpolate like np.interp."""
+    x = np.linspace(0, 9e-3, 10)
+    inner = x[3:7].copy()
+    shifted = inner.copy()
+    shifted[1] += 1e-4  # same endpoints, different interior
+    for cls, values in [
+        (ps.Signal, np.sin(x * 1e3)),
+        (ps.Spectrum, np.exp(1j * x * 1e3)),
+    ]:
+        outer = cls(x, values)
+        assert np.shares_memory(outer._interp(inner), outer.values)
+        for axis in [inner, shifted]:
+            expected = np.interp(axis, x, values)
+            assert np.array_equal(outer._interp(axis), expected)
+            total = outer + cls(axis, np.ones(axis.size))
+            assert np.array_equal(total.x, np.union1d(x, axis))
+            expected = np.interp(total.x, x, values) + np.interp(
+                total.x, axis, np.ones(axis.size)
+            )
+            assert np.allclose(total.values, expected)
+
+
+def test_values_updates():
+    """Reassigned and in-place modified values show up in later arithmetic."""
+    sp = ps.Spectrum([0.0, 1.0, 2.0], [1 + 1j, 2, 3])
+    other = ps.Spectrum([0.0, 0.5, 2.0], [0, 0, 0])
+    sp + other
+    sp.values = np.array([0, 2j, 4])
+    assert np.allclose((sp + other).values, [0, 1j, 2j, 4])
+    sp.values[2] = 1j
+    assert np.allclose((sp + other).values, [0, 1j, 2j, 1j])
+    assert np.allclose((sp * 2).values, [0, 4j, 2j])
+
+    sig = ps.Signal([0.0, 1.0, 2.0], [0, 1, 2])
+    sig + ps.Signal([0.0, 0.5, 2.0], [0, 0, 0])
+    sig.values[1] = 10
+    total = sig + ps.Signal([0.0, 0.5, 2.0], [0, 0, 0])
+    assert np.allclose(total.values, [0, 5, 10, 2])
+
+
 if __name__ == "__main__":
     test_fft_plot()
     test_time_ops()
     test_create_save_load()
+    test_merged_axis()
+    test_batch_fft()
+    test_nrange()
+    test_create_matches_eval()
+    test_create_names()
+    test_long_merged_axis()
+    test_interp_edges()
+    test_interp_kernel()
+    test_unary_long_readonly()
+    test_time_lookup()
+    test_interp_subrange()
+    test_values_updates()